@@ -0,0 +1,674 @@
+#!/usr/bin/env python3
+import argparse
+import ast
+import mmap
+import re
+import sys
+from concurrent.futures import ProcessPoolExecutor
+from dataclasses import dataclass, field, replace
+from typing import List, Dict, Optional, Any, Tuple, Callable, Set, Union
+from pathlib import Path
+from colorama import init, Fore, Style
+
+# Initialize colorama for cross-platform colored output
+init()
+
+# Report fragments, built once instead of for every line printed
+_RESET_LINE = f"{Style.RESET_ALL}\n"
+_BAR = f"{Fore.CYAN}{'═' * 80}{_RESET_LINE}"
+_TITLE_PREFIX = f"{Fore.CYAN}{Style.BRIGHT}  Python Complexity Analysis: "
+_FN_PREFIX = f"{Fore.GREEN}{Style.BRIGHT}Function/Method:{Style.RESET_ALL} {Fore.YELLOW}"
+_COMPLEXITY_PREFIX = f"  {Fore.BLUE}{Style.BRIGHT}Complexity:{Style.RESET_ALL} {Fore.MAGENTA}"
+_APPROX_SUFFIX = f"{Style.RESET_ALL}{Fore.RED}{Style.BRIGHT} *{_RESET_LINE}"
+_EXACT_SUFFIX = f"{Style.RESET_ALL}{Fore.RED}{Style.BRIGHT}{_RESET_LINE}"
+_DETAILS_HEADER = f"  {Fore.BLUE}{Style.BRIGHT}Details:{_RESET_LINE}"
+_ISSUES_HEADER = f"  {Fore.YELLOW}{Style.BRIGHT}⚠ Performance Issues:{_RESET_LINE}"
+_ISSUE_PREFIX = f"    {Fore.RED}•{Style.RESET_ALL} [line "
+_APPROX_NOTE = (
+    f"{Fore.YELLOW}{Style.BRIGHT}Note:{Style.RESET_ALL} {Fore.RED}{Style.BRIGHT}*{Style.RESET_ALL} "
+    f"Complexity marked with * is approximate due to static analysis limitations\n"
+)
+
+# A complexity is stored as a sum of terms rather than as a string. Each term is
+# (n_power, log_power, other_factors), e.g. O(n²*log(n)) is (2, 1, ()) and
+# O(n)*O(?) is (1, 0, ("?",)). The constant O(1) term is never stored.
+Term = Tuple[int, int, Tuple[str, ...]]
+
+POWER_NOTATION = {2: "²", 3: "³", 4: "⁴"}
+POWER_PARSE = {"²": 2, "³": 3, "⁴": 4}
+
+# O(...) factors, allowing one level of nested parentheses as in O(n*log(n))
+_FACTOR = re.compile(r'O\(((?:[^()]|\([^()]*\))*)\)')
+# '+' signs that aren't inside parentheses
+_PLUS_SPLIT = re.compile(r'\+(?![^()]*\))')
+
+def _parse_term(expr: str) -> Term:
+    """Parse a product such as O(n)*O(n*log(n))*O(?) into a single term"""
+    n_power = 0
+    log_power = 0
+    other: Tuple[str, ...] = ()
+    
+    for inner in _FACTOR.findall(expr) or [expr]:
+        for part in inner.split('*') if '*' in inner else (inner,):
+            if part == "1":
+                continue
+            elif part == "n":
+                n_power += 1
+            elif part == "log(n)":
+                log_power += 1
+            elif part[:1] == "n" and part[1:] in POWER_PARSE:
+                n_power += POWER_PARSE[part[1:]]
+            elif part.startswith("n^") and part[2:].isdigit():
+                n_power += int(part[2:])
+            else:
+                other += (part,)
+    
+    return n_power, log_power, other
+
+def _render_term(term: Term) -> str:
+    n_power, log_power, other = term
+    parts = []
+    if n_power == 1:
+        parts.append("n")
+    elif n_power in POWER_NOTATION:
+        parts.append(f"n{POWER_NOTATION[n_power]}")
+    elif n_power:
+        parts.append(f"n^{n_power}")
+    if log_power == 1:
+        parts.append("log(n)")
+    elif log_power:
+        parts.append(f"log(n)^{log_power}")
+    
+    factors = [f"O({'*'.join(parts)})"] if parts else []
+    factors.extend(f"O({factor})" for factor in other)
+    return "*".join(factors) if factors else "O(1)"
+
+# Renderings of the most common sums, so they're shared rather than rebuilt
+_COMMON_EXPRESSIONS: Dict[Tuple[Term, ...], str] = {
+    (): "O(1)",
+    ((1, 0, ()),): "O(n)",
+    ((1, 1, ()),): "O(n*log(n))",
+    ((2, 0, ()),): "O(n²)",
+    ((0, 0, ("?",)),): "O(?)",
+}
+
+@dataclass(frozen=True, slots=True)
+class Complexity:
+    terms: Tuple[Term, ...] = ()  # an empty sum is O(1)
+    is_approximate: bool = False
+    details: Tuple[str, ...] = ()
+    # rough weight for comparing complexities, i.e. the highest (n_power, log_power)
+    _weight: Tuple[int, int] = field(init=False, repr=False, compare=False)
+    
+    def __post_init__(self) -> None:
+        weight = max((term[:2] for term in self.terms), default=(0, 0))
+        object.__setattr__(self, '_weight', weight)
+    
+    # the common factories hand out shared instances, which is safe since they're frozen
+    @classmethod
+    def constant(cls) -> 'Complexity':
+        return _CONST
+    
+    @classmethod
+    def linear(cls, coefficient: int = 1) -> 'Complexity':
+        # constant coefficients don't change the order of growth
+        return _LIN
+    
+    @classmethod
+    def linearithmic(cls) -> 'Complexity':
+        return _NLOGN
+    
+    @classmethod
+    def approximate(cls, expr: str) -> 'Complexity':
+        return cls.from_expression(expr, True)
+    
+    @classmethod
+    def from_expression(cls, expr: str, is_approximate: bool = False) -> 'Complexity':
+        """Parse a rendered expression such as O(n²)+O(n)*O(?)"""
+        if '+' in expr:
+            terms = tuple(_parse_term(part) for part in _PLUS_SPLIT.split(expr))
+        else:
+            terms = (_parse_term(expr),)
+        return cls(tuple(t for t in terms if t != (0, 0, ())), is_approximate, ())
+    
+    @property
+    def expression(self) -> str:
+        """Render the complexity, e.g. O(n²*log(n))+O(n)"""
+        common = _COMMON_EXPRESSIONS.get(self.terms)
+        if common is not None:
+            return common
+        return "+".join(_render_term(term) for term in self.terms)
+    
+    def with_detail(self, detail: str) -> 'Complexity':
+        return replace(self, details=self.details + (detail,))
+    
+    def combine_sequential(self, other: 'Complexity') -> 'Complexity':
+        """For sequential operations, we add complexities"""
+        # adding O(1) changes nothing
+        if other is _CONST:
+            return self
+        if self is _CONST:
+            return other
+        
+        is_approx = self.is_approximate or other.is_approximate
+        details = self.details + other.details
+        
+        # O(1) terms are never stored, so adding is just concatenation
+        return Complexity(self.terms + other.terms, is_approx, details)
+    
+    def combine_nested(self, other: 'Complexity') -> 'Complexity':
+        """For nested operations, we multiply complexities"""
+        if other is _CONST:
+            return self
+        if self is _CONST:
+            return other
+        
+        is_approx = self.is_approximate or other.is_approximate
+        details = self.details + other.details
+        
+        if not self.terms:
+            terms = other.terms
+        elif not other.terms:
+            terms = self.terms
+        else:
+            # distribute the product over both sums, adding exponents
+            terms = tuple(
+                (a[0] + b[0], a[1] + b[1], a[2] + b[2])
+                for a in self.terms
+                for b in other.terms
+            )
+        
+        return Complexity(terms, is_approx, details)
+    
+    def max(self, other: 'Complexity') -> 'Complexity':
+        """Return the maximum complexity (for if/else branches)"""
+        # For branches, we should take the worse case
+        # This is a simplified comparison
+        return self if self._weight >= other._weight else other
+    
+    def simplify(self) -> 'Complexity':
+        """Simplify the complexity expression WITHOUT reducing to dominant term"""
+        # terms are kept in normalized form as they are combined
+        return self
+
+# Shared, immutable complexities for calls with well-known costs
+_CONST = Complexity()
+_LIN = Complexity(((1, 0, ()),))
+_NLOGN = Complexity(((1, 1, ()),))
+_UNKNOWN = Complexity.approximate("O(?)")
+# Placeholder for a function whose body is still being analyzed
+_IN_PROGRESS = Complexity.approximate("O(?)")
+
+# Built-in functions with known complexity
+BUILTIN_COMPLEXITY = {
+    'len': _CONST,
+    'print': _CONST,
+    'sum': _LIN,
+    'max': _LIN,
+    'min': _LIN,
+    'sorted': _NLOGN,
+    'reversed': _LIN,
+    'enumerate': _CONST,
+    'zip': _CONST,
+    'map': _CONST,
+    'filter': _CONST,
+    'list': _LIN,
+    'set': _LIN,
+    'dict': _CONST,
+    'all': _LIN,
+    'any': _LIN,
+}
+
+# Common container methods with known complexity
+METHOD_COMPLEXITY = {
+    'append': _CONST,
+    'pop': _CONST,
+    'insert': _LIN,
+    'remove': _LIN,
+    'sort': _NLOGN,
+    'index': _LIN,
+    'count': _LIN,
+    'extend': _LIN,
+    'copy': _LIN,
+    'clear': _CONST,
+    'get': _CONST,
+    'items': _LIN,
+    'keys': _LIN,
+    'values': _LIN,
+    'update': _LIN,
+    'add': _CONST,  # set.add
+    'discard': _CONST,  # set.discard
+    'union': _LIN,
+    'intersection': _LIN,
+    'difference': _LIN,
+}
+
+@dataclass
+class AntiPattern:
+    line: int
+    pattern_type: str
+    description: str
+
+@dataclass
+class FunctionAnalysis:
+    name: str
+    complexity: Complexity
+    anti_patterns: List[AntiPattern]
+
+def is_trivial_body(body: List[ast.stmt]) -> bool:
+    """Check for a body that is just `pass`, a docstring, or returns a plain value"""
+    if len(body) != 1:
+        return False
+    stmt = body[0]
+    if isinstance(stmt, ast.Pass):
+        return True
+    if isinstance(stmt, ast.Expr):
+        return isinstance(stmt.value, ast.Constant)
+    if isinstance(stmt, ast.Return):
+        return stmt.value is None or isinstance(stmt.value, (ast.Constant, ast.Name, ast.Attribute))
+    return False
+
+class Analyzer(ast.NodeVisitor):
+    def __init__(self) -> None:
+        self.functions: Dict[str, Complexity] = {}
+        self.variable_types: Dict[str, str] = {}
+        self.current_class: Optional[str] = None
+        self.results: List[FunctionAnalysis] = []
+        self.anti_patterns: List[AntiPattern] = []
+        self._ap_seen: Set[Tuple[int, str]] = set()  # (line, pattern_type) already reported
+        
+    def analyze_file(self, content: str, filename: str = "<file>") -> List[FunctionAnalysis]:
+        """Analyze Python file content"""
+        return self.analyze_tree(parse_source(content, filename))
+    
+    def analyze_tree(self, tree: ast.AST) -> List[FunctionAnalysis]:
+        """Analyze an already parsed module"""
+        self.visit(tree)
+        return self.results
+    
+    def visit_ClassDef(self, node: ast.ClassDef) -> None:
+        """Visit class definition"""
+        old_class = self.current_class
+        self.current_class = node.name
+        self.visit_definitions(node.body)
+        self.current_class = old_class
+    
+    def visit_Module(self, node: ast.Module) -> None:
+        """Visit module"""
+        self.visit_definitions(node.body)
+    
+    def visit_definitions(self, body: List[ast.stmt]) -> None:
+        """Visit the function and class definitions in a block, skipping everything else"""
+        for child in body:
+            if isinstance(child, (ast.FunctionDef, ast.AsyncFunctionDef, ast.ClassDef)):
+                self.visit(child)
+            elif hasattr(child, 'body') or hasattr(child, 'cases'):
+                # definitions can also be nested in if/try/with/match blocks
+                self.generic_visit(child)
+    
+    def visit_FunctionDef(self, node: ast.FunctionDef) -> None:
+        """Visit function definition"""
+        self._analyze_funcdef(node)
+    
+    def visit_AsyncFunctionDef(self, node: ast.AsyncFunctionDef) -> None:
+        """Visit async function definition"""
+        self._analyze_funcdef(node)
+    
+    def _analyze_funcdef(self, node: Union[ast.FunctionDef, ast.AsyncFunctionDef]) -> None:
+        """Analyze a function body and record the result"""
+        self.anti_patterns = []
+        self._ap_seen.clear()
+        self.variable_types.clear()
+        
+        # Store function name with class prefix if in a class
+        if self.current_class:
+            func_name = f"{self.current_class}.{node.name}"
+        else:
+            func_name = node.name
+        
+        if is_trivial_body(node.body):
+            # getters, stubs and the like are always O(1), no need to walk them
+            complexity = _CONST
+        else:
+            self.record_arg_types(node.args)
+            
+            # Mark the function as in progress so recursive calls can be detected
+            self.functions[func_name] = _IN_PROGRESS
+            
+            # Analyze function body
+            complexity = self.analyze_body(node.body)
+        
+        self.functions[func_name] = complexity
+        
+        analysis = FunctionAnalysis(
+            name=func_name,
+            complexity=complexity,
+            anti_patterns=self.anti_patterns.copy()
+        )
+        self.results.append(analysis)
+        
+        # Don't visit nested functions
+        return
+    
+    def record_arg_types(self, args: ast.arguments) -> None:
+        """Extract type annotations from parameters"""
+        for arg in args.args:
+            ann = arg.annotation
+            if ann is None:
+                continue
+            if isinstance(ann, ast.Subscript):
+                # Handle List[int], Dict[str, int], etc.
+                ann = ann.value
+            if isinstance(ann, ast.Name):
+                self.variable_types[arg.arg] = ann.id
+    
+    def analyze_body(self, body: List[ast.stmt]) -> Complexity:
+        """Analyze a list of statements"""
+        total = Complexity.constant()
+        
+        for stmt in body:
+            stmt_complexity = self.analyze_statement(stmt)
+            total = total.combine_sequential(stmt_complexity)
+        
+        return total.simplify()
+    
+    def analyze_statement(self, stmt: ast.stmt) -> Complexity:
+        """Analyze a single statement"""
+        handler = _STMT_HANDLERS.get(type(stmt))
+        return handler(self, stmt) if handler else _CONST
+    
+    def analyze_value(self, stmt: Union[ast.Return, ast.Expr, ast.Assign, ast.AugAssign, ast.AnnAssign]) -> Complexity:
+        """Analyze a return, expression or assignment statement by its value"""
+        if stmt.value:
+            return self.analyze_expr(stmt.value)
+        return Complexity.constant()
+    
+    def analyze_for_loop(self, node: ast.For) -> Complexity:
+        """Analyze for loop complexity"""
+        iter_complexity = self.estimate_iteration_count(node.iter)
+        body_complexity = self.analyze_body(node.body)
+        
+        combined = iter_complexity.combine_nested(body_complexity)
+        return combined.with_detail("for loop").simplify()
+    
+    def analyze_while_loop(self, node: ast.While) -> Complexity:
+        """Analyze while loop complexity"""
+        body_complexity = self.analyze_body(node.body)
+        
+        # While loops have unknown iterations in static analysis
+        if not body_complexity.terms:
+            result = Complexity.linear(1)
+        else:
+            result = replace(body_complexity.combine_nested(Complexity.linear(1)), is_approximate=True)
+        
+        return result.with_detail("while loop (unknown iterations)").simplify()
+    
+    def analyze_if(self, node: ast.If) -> Complexity:
+        """Analyze if statement - take max of branches"""
+        if_body = self.analyze_body(node.body)
+        else_body = self.analyze_body(node.orelse)
+        return if_body.max(else_body)
+    
+    def estimate_iteration_count(self, iter_node: ast.expr) -> Complexity:
+        """Estimate iteration count for loop iterator"""
+        if isinstance(iter_node, ast.Call):
+            if isinstance(iter_node.func, ast.Name):
+                if iter_node.func.id == 'range':
+                    return Complexity.linear(1)
+                elif iter_node.func.id in ('enumerate', 'zip'):
+                    # These iterate over their arguments
+                    if iter_node.args:
+                        return self.estimate_iteration_count(iter_node.args[0])
+                    return Complexity.linear(1)
+            return Complexity.approximate("O(n)")
+        elif isinstance(iter_node, (ast.Name, ast.Attribute)):
+            return Complexity.linear(1)
+        elif isinstance(iter_node, (ast.List, ast.Tuple)):
+            # Literal list/tuple - count elements
+            return Complexity.linear(1)
+        else:
+            return Complexity.approximate("O(n)")
+    
+    def analyze_expr(self, expr: ast.expr) -> Complexity:
+        """Analyze expression complexity"""
+        handler = _EXPR_HANDLERS.get(type(expr))
+        return handler(self, expr) if handler else _CONST
+    
+    def analyze_lambda(self, node: ast.Lambda) -> Complexity:
+        """Analyze lambda body as expression"""
+        return self.analyze_expr(node.body)
+    
+    def analyze_list(self, node: ast.List) -> Complexity:
+        """Analyze a list literal by its elements"""
+        total = Complexity.constant()
+        for el in node.elts:
+            total = total.combine_sequential(self.analyze_expr(el))
+        return total
+    
+    def add_anti_pattern(self, line: int, pattern_type: str, description: str) -> None:
+        """Record an anti-pattern, ignoring repeats of the same pattern on the same line"""
+        key = (line, pattern_type)
+        if key not in self._ap_seen:
+            self._ap_seen.add(key)
+            self.anti_patterns.append(AntiPattern(line, pattern_type, description))
+    
+    def analyze_comprehension(self, node: Union[ast.ListComp, ast.SetComp, ast.DictComp, ast.GeneratorExp]) -> Complexity:
+        """Analyze list/set/dict comprehension or generator expression"""
+        complexity = Complexity.constant()
+        
+        for generator in node.generators:
+            iter_complexity = self.estimate_iteration_count(generator.iter)
+            complexity = complexity.combine_nested(iter_complexity)
+        
+        # Check for anti-pattern (using list comp where generator would work)
+        if isinstance(node, ast.ListComp):
+            self.add_anti_pattern(
+                node.lineno,
+                "list_comprehension",
+                "List comprehension could potentially be replaced with generator expression for memory efficiency"
+            )
+        
+        return complexity.with_detail("comprehension").simplify()
+    
+    def analyze_call(self, node: ast.Call) -> Complexity:
+        """Analyze function call complexity"""
+        if isinstance(node.func, ast.Name):
+            func_name = node.func.id
+            
+            complexity = BUILTIN_COMPLEXITY.get(func_name)
+            if complexity is not None:
+                # copying constructors are only O(n) when given something to copy
+                if not node.args and func_name in ('list', 'set'):
+                    complexity = _CONST
+            elif func_name in self.functions:
+                # Stored complexities are frozen, so they can be reused as is
+                complexity = self.functions[func_name]
+                if complexity is _IN_PROGRESS:
+                    complexity = _UNKNOWN.with_detail(f"recursive call to {func_name}")
+            else:
+                complexity = Complexity.approximate("O(?)")
+                complexity = complexity.with_detail(f"unknown function: {func_name}")
+            
+            # Analyze arguments
+            for arg in node.args:
+                arg_complexity = self.analyze_expr(arg)
+                complexity = complexity.combine_sequential(arg_complexity)
+            
+            return complexity
+            
+        elif isinstance(node.func, ast.Attribute):
+            return self.analyze_method_call(node.func)
+        else:
+            return Complexity.approximate("O(?)")
+    
+    def analyze_method_call(self, attr: ast.Attribute) -> Complexity:
+        """Analyze method call complexity"""
+        return METHOD_COMPLEXITY.get(attr.attr, _UNKNOWN)
+    
+    def analyze_compare(self, node: ast.Compare) -> Complexity:
+        """Analyze comparison operations"""
+        for i, op in enumerate(node.ops):
+            if isinstance(op, (ast.In, ast.NotIn)):
+                if i < len(node.comparators):
+                    comparator = node.comparators[i]
+                    
+                    if isinstance(comparator, ast.List):
+                        # List literal membership test - always O(n)
+                        self.add_anti_pattern(
+                            node.lineno,
+                            "list_membership",
+                            "Membership test with list literal - use set for O(1) lookup instead of O(n)"
+                        )
+                        return Complexity.linear(1).with_detail("list membership check")
+                    
+                    elif isinstance(comparator, ast.Set):
+                        # Set literal membership test - O(1)
+                        return Complexity.constant().with_detail("set membership check")
+                    
+                    elif isinstance(comparator, ast.Name):
+                        # Check variable type if known
+                        var_type = self.variable_types.get(comparator.id)
+                        if var_type in ('List', 'list'):
+                            self.add_anti_pattern(
+                                node.lineno,
+                                "membership_check",
+                                "Membership test with List type - consider using Set for O(1) lookup instead of O(n)"
+                            )
+                            return Complexity.linear(1).with_detail("list membership check")
+                        elif var_type in ('Set', 'set', 'Dict', 'dict'):
+                            return Complexity.constant().with_detail("set/dict membership check")
+                        else:
+                            # Unknown type - assume worst case (list)
+                            self.add_anti_pattern(
+                                node.lineno,
+                                "membership_check",
+                                "Membership test with unknown type - if this is a list, consider using set for O(1) lookup"
+                            )
+                            return Complexity.approximate("O(n)").with_detail("membership check (unknown type)")
+                    
+                    elif isinstance(comparator, ast.Attribute):
+                        # Accessing an attribute - assume list for worst case
+                        self.add_anti_pattern(
+                            node.lineno,
+                            "membership_check",
+                            "Membership test with unknown type - if this is a list, consider using set for O(1) lookup"
+                        )
+                        return Complexity.approximate("O(n)").with_detail("membership check (unknown type)")
+        
+        return Complexity.constant()
+
+# Dispatch on the exact node type instead of a chain of isinstance checks.
+# Each handler takes one concrete node type, which is only known from the
+# dict key, so the node parameter is typed Any here
+NodeHandler = Callable[[Analyzer, Any], Complexity]
+
+_STMT_HANDLERS: Dict[type, NodeHandler] = {
+    ast.For: Analyzer.analyze_for_loop,
+    ast.While: Analyzer.analyze_while_loop,
+    ast.If: Analyzer.analyze_if,
+    ast.Return: Analyzer.analyze_value,
+    ast.Expr: Analyzer.analyze_value,
+    ast.Assign: Analyzer.analyze_value,
+    ast.AugAssign: Analyzer.analyze_value,
+    ast.AnnAssign: Analyzer.analyze_value,
+}
+
+_EXPR_HANDLERS: Dict[type, NodeHandler] = {
+    ast.ListComp: Analyzer.analyze_comprehension,
+    ast.SetComp: Analyzer.analyze_comprehension,
+    ast.DictComp: Analyzer.analyze_comprehension,
+    ast.GeneratorExp: Analyzer.analyze_comprehension,
+    ast.Call: Analyzer.analyze_call,
+    ast.Compare: Analyzer.analyze_compare,
+    ast.Lambda: Analyzer.analyze_lambda,
+    ast.List: Analyzer.analyze_list,
+}
+
+def parse_source(content: Union[str, bytes, mmap.mmap], filename: str = "<file>") -> ast.AST:
+    """Parse file content into a module AST"""
+    # call compile() directly rather than going through ast.parse(); the AST
+    # optimizer is deliberately left off, since on 3.13+ it folds `x in [a, b]`
+    # into a tuple and would hide the list membership anti-pattern
+    try:
+        return compile(content, filename, 'exec', flags=ast.PyCF_ONLY_AST, dont_inherit=True)
+    except SyntaxError as e:
+        raise ValueError(f"Parse error: {e}")
+
+def _analyze_one(path: Path) -> Tuple[Path, List[FunctionAnalysis]]:
+    """Analyze a single file; kept at module level so worker processes can run it"""
+    # the file is mapped into memory rather than read into a decoded str, and
+    # parsed before the mapping is closed
+    try:
+        if path.stat().st_size == 0:
+            tree = parse_source(b"", str(path))  # empty files can't be mapped
+        else:
+            with open(path, 'rb') as f, mmap.mmap(f.fileno(), 0, access=mmap.ACCESS_READ) as mm:
+                tree = parse_source(mm, str(path))
+    except OSError as e:
+        raise OSError(f"Failed to read file: {e}") from e
+    return path, Analyzer().analyze_tree(tree)
+
+def _render(path: Path, results: List[FunctionAnalysis], verbose: bool) -> str:
+    """Build the report for one file"""
+    out = [
+        f"\n{_BAR}",
+        f"{_TITLE_PREFIX}{path}{Style.RESET_ALL}\n",
+        f"{_BAR}\n",
+    ]
+    
+    has_approximate = any(r.complexity.is_approximate for r in results)
+    
+    for analysis in results:
+        suffix = _APPROX_SUFFIX if analysis.complexity.is_approximate else _EXACT_SUFFIX
+        
+        out.append(f"{_FN_PREFIX}{analysis.name}{_RESET_LINE}")
+        out.append(f"{_COMPLEXITY_PREFIX}{analysis.complexity.expression}{suffix}")
+        
+        if verbose and analysis.complexity.details:
+            out.append(_DETAILS_HEADER)
+            for detail in analysis.complexity.details:
+                out.append(f"    - {detail}\n")
+        
+        if analysis.anti_patterns:
+            out.append(_ISSUES_HEADER)
+            for ap in analysis.anti_patterns:
+                out.append(f"{_ISSUE_PREFIX}{ap.line}]: {Fore.YELLOW}{ap.description}{_RESET_LINE}")
+        
+        out.append("\n")
+    
+    if has_approximate:
+        out.append(_APPROX_NOTE)
+    
+    return "".join(out)
+
+def main() -> None:
+    parser = argparse.ArgumentParser(
+        description="Analyze algorithmic complexity of Python code"
+    )
+    parser.add_argument('file', type=Path, nargs='+', help='Python file(s) to analyze')
+    parser.add_argument('-v', '--verbose', action='store_true', 
+                       help='Show detailed analysis')
+    
+    args = parser.parse_args()
+    
+    # Files are analyzed independently, so spread them over worker processes;
+    # reports are still written here, in the order the files were given
+    with ProcessPoolExecutor() as executor:
+        if len(args.file) > 1:
+            outcomes = executor.map(_analyze_one, args.file)
+        else:
+            # not worth starting a worker for a single file
+            outcomes = map(_analyze_one, args.file)
+        
+        try:
+            for path, results in outcomes:
+                sys.stdout.write(_render(path, results, args.verbose))
+        except OSError as e:
+            print(f"{Fore.RED}{Style.BRIGHT}Error:{Style.RESET_ALL} {e}")
+            sys.exit(1)
+        except ValueError as e:
+            print(f"{Fore.RED}{Style.BRIGHT}Analysis failed:{Style.RESET_ALL} {e}")
+            sys.exit(1)
+
+if __name__ == "__main__":
+    main()
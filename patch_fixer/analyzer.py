@@ -2,13 +2,24 @@
 
 import re
 from dataclasses import dataclass
+from operator import itemgetter
 from typing import List, Dict, Optional, Any
 
-from .regex import match_line
+from .regex import match_line, regexes
 from .validators import count_hunk_lines, is_binary_diff
 
+_LINE_END = itemgetter(slice(-2, None))
+_HUNK_HEADER = regexes["HUNK_HEADER"]
+_DIFF_LINE = regexes["DIFF_LINE"]
 
-@dataclass
+# line prefixes and the lenient hunk header check used by find_potential_issues
+_DIFF_PREFIX = "diff "
+_FILE_HEADER_PREFIXES = ("---", "+++")
+_HUNK_PREFIX = "@@"
+_LOOSE_HUNK_HEADER = re.compile(r'@@\s*-\d+(?:,\d+)?\s+\+\d+(?:,\d+)?\s*@@')
+
+
+@dataclass(slots=True)
 class HunkInfo:
     """Information about a single hunk."""
     old_start: int
@@ -22,7 +33,7 @@ class HunkInfo:
     line_number: int  # line number in the patch file
 
 
-@dataclass
+@dataclass(slots=True)
 class FileInfo:
     """Information about a single file in a patch."""
     source_path: str
@@ -36,7 +47,7 @@ class FileInfo:
     line_number: int  # line number in the patch file where this diff starts
 
 
-@dataclass
+@dataclass(slots=True)
 class PatchInfo:
     """Complete information about a patch."""
     files: List[FileInfo]
@@ -66,10 +77,21 @@ def analyze_patch(patch_lines: List[str], strict: bool = False) -> PatchInfo:
 
     current_file = None
     current_hunks = []
-    i = 0
+    # hunk whose lines are still being collected, if any
+    hunk = None
+    hunk_lines = []
+
+    for i, line in enumerate(patch_lines):
+        if hunk is not None:
+            # hunk lines are collected until the next hunk or diff header,
+            # without classifying each of them along the way
+            if not _ends_hunk(line):
+                hunk_lines.append(line)
+                continue
+
+            _count_hunk(hunk, hunk_lines, strict, errors)
+            hunk = None
 
-    while i < len(patch_lines):
-        line = patch_lines[i]
         match_groups, line_type = match_line(line)
 
         if line_type == "DIFF_LINE":
@@ -128,56 +150,27 @@ def analyze_patch(patch_lines: List[str], strict: bool = False) -> PatchInfo:
         elif line_type == "HUNK_HEADER" and current_file:
             # parse hunk header
             try:
-                old_start = int(match_groups[0]) if match_groups[0] else 0
-                old_count = int(match_groups[1]) if match_groups[1] else 1
-                new_start = int(match_groups[2]) if match_groups[2] else 0
-                new_count = int(match_groups[3]) if match_groups[3] else 1
-                context = match_groups[4] if len(match_groups) > 4 else ""
-
-                # collect hunk lines until next header or diff
-                hunk_lines = []
-                j = i + 1
-                while j < len(patch_lines):
-                    next_line = patch_lines[j]
-                    _, next_type = match_line(next_line)
-                    if next_type in ("HUNK_HEADER", "DIFF_LINE"):
-                        break
-                    hunk_lines.append(next_line)
-                    j += 1
-
-                added, removed, context_count = count_hunk_lines(hunk_lines)
-
                 hunk = HunkInfo(
-                    old_start=old_start,
-                    old_count=old_count,
-                    new_start=new_start,
-                    new_count=new_count,
-                    context=context,
-                    added_lines=added,
-                    removed_lines=removed,
-                    context_lines=context_count,
+                    old_start=int(match_groups[0]) if match_groups[0] else 0,
+                    old_count=int(match_groups[1]) if match_groups[1] else 1,
+                    new_start=int(match_groups[2]) if match_groups[2] else 0,
+                    new_count=int(match_groups[3]) if match_groups[3] else 1,
+                    context=match_groups[4] if len(match_groups) > 4 else "",
+                    added_lines=0,
+                    removed_lines=0,
+                    context_lines=0,
                     line_number=i + 1
                 )
-
-                # validate counts if strict
-                if strict:
-                    if old_count != removed + context_count:
-                        errors.append(
-                            f"Line {i + 1}: Hunk old count mismatch: "
-                            f"expected {old_count}, got {removed + context_count}"
-                        )
-                    if new_count != added + context_count:
-                        errors.append(
-                            f"Line {i + 1}: Hunk new count mismatch: "
-                            f"expected {new_count}, got {added + context_count}"
-                        )
-
-                current_hunks.append(hunk)
-                i = j - 1  # will be incremented at end of loop
             except (ValueError, IndexError) as e:
                 errors.append(f"Line {i + 1}: Failed to parse hunk header: {e}")
+            else:
+                # line counts are filled in once the hunk's lines are collected
+                current_hunks.append(hunk)
+                hunk_lines = []
 
-        i += 1
+    # the patch may end in the middle of a hunk
+    if hunk is not None:
+        _count_hunk(hunk, hunk_lines, strict, errors)
 
     # don't forget the last file
     if current_file:
@@ -207,6 +200,37 @@ def analyze_patch(patch_lines: List[str], strict: bool = False) -> PatchInfo:
     )
 
 
+def _ends_hunk(line: str) -> bool:
+    """Check whether a line starts a new hunk or diff, ending the current hunk."""
+    # only lines with the right prefix can match, so skip the regex for the rest
+    if line.startswith("@@"):
+        return _HUNK_HEADER.match(line) is not None
+    if line.startswith("diff"):
+        return _DIFF_LINE.match(line) is not None
+    return False
+
+
+def _count_hunk(hunk: HunkInfo, hunk_lines: List[str], strict: bool, errors: List[str]) -> None:
+    """Fill in a hunk's line counts, checking them against its header if strict."""
+    added, removed, context_count = count_hunk_lines(hunk_lines)
+    hunk.added_lines = added
+    hunk.removed_lines = removed
+    hunk.context_lines = context_count
+
+    # validate counts if strict
+    if strict:
+        if hunk.old_count != removed + context_count:
+            errors.append(
+                f"Line {hunk.line_number}: Hunk old count mismatch: "
+                f"expected {hunk.old_count}, got {removed + context_count}"
+            )
+        if hunk.new_count != added + context_count:
+            errors.append(
+                f"Line {hunk.line_number}: Hunk new count mismatch: "
+                f"expected {hunk.new_count}, got {added + context_count}"
+            )
+
+
 def find_potential_issues(patch_lines: List[str]) -> List[str]:
     """
     Scan patch for potential issues that might need fixing.
@@ -220,14 +244,18 @@ def find_potential_issues(patch_lines: List[str]) -> List[str]:
     has_diff_header = False
     has_file_headers = False
     has_hunks = False
+    # line numbers of hunk headers that look malformed, reported further down
+    malformed_hunks = []
 
-    for line in patch_lines:
-        if line.startswith("diff "):
+    for i, line in enumerate(patch_lines):
+        if line.startswith(_DIFF_PREFIX):
             has_diff_header = True
-        elif line.startswith("---") or line.startswith("+++"):
+        elif line.startswith(_FILE_HEADER_PREFIXES):
             has_file_headers = True
-        elif line.startswith("@@"):
+        elif line.startswith(_HUNK_PREFIX):
             has_hunks = True
+            if not _LOOSE_HUNK_HEADER.match(line):
+                malformed_hunks.append(i + 1)
 
     if has_hunks and not has_diff_header:
         warnings.append("Patch has hunks but no diff header")
@@ -235,24 +263,24 @@ def find_potential_issues(patch_lines: List[str]) -> List[str]:
     if has_hunks and not has_file_headers:
         warnings.append("Patch has hunks but no file headers (--- and +++ lines)")
 
-    # check for inconsistent line endings
+    # check for inconsistent line endings; collecting the distinct last two
+    # characters of each line happens in C, leaving only a handful to classify
     line_endings = set()
-    for line in patch_lines:
-        if line.endswith('\r\n'):
+    for ending in set(map(_LINE_END, patch_lines)):
+        if ending == '\r\n':
             line_endings.add('CRLF')
-        elif line.endswith('\n'):
+        elif ending.endswith('\n'):
             line_endings.add('LF')
-        elif line.endswith('\r'):
+        elif ending.endswith('\r'):
             line_endings.add('CR')
 
     if len(line_endings) > 1:
-        warnings.append(f"Inconsistent line endings found: {', '.join(line_endings)}")
+        found = [name for name in ('CRLF', 'LF', 'CR') if name in line_endings]
+        warnings.append(f"Inconsistent line endings found: {', '.join(found)}")
 
     # check for malformed hunk headers
-    for i, line in enumerate(patch_lines):
-        if line.startswith("@@"):
-            if not re.match(r'@@\s*-\d+(?:,\d+)?\s+\+\d+(?:,\d+)?\s*@@', line):
-                warnings.append(f"Line {i + 1}: Potentially malformed hunk header")
+    for line_number in malformed_hunks:
+        warnings.append(f"Line {line_number}: Potentially malformed hunk header")
 
     # check for truncated patches
     if patch_lines and patch_lines[-1].startswith(('+', '-')) and not patch_lines[-1].endswith('\n'):
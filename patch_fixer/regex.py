@@ -15,10 +15,29 @@ regexes = {
     "END_LINE": re.compile(r'^\\ No newline at end of file$'),
 }
 
+# all of the above as one alternation, so a line is classified with a single
+# match call; alternatives are tried in order, just like looping over regexes
+_any_line = re.compile("|".join(
+    f"(?P<{line_type}>{regex.pattern})" for line_type, regex in regexes.items()
+))
+# where each line type's own groups sit among the alternation's groups
+_group_spans = {
+    line_type: (_any_line.groupindex[line_type], _any_line.groupindex[line_type] + regex.groups)
+    for line_type, regex in regexes.items()
+}
+
+
+def _classify_line(line):
+    """Return the type of a patch line and the match, or (None, None)."""
+    match = _any_line.match(line)
+    if match:
+        return match.lastgroup, match
+    return None, None
+
 
 def match_line(line):
-    for line_type, regex in regexes.items():
-        match = regex.match(line)
-        if match:
-            return match.groups(), line_type
+    line_type, match = _classify_line(line)
+    if match:
+        start, end = _group_spans[line_type]
+        return match.groups()[start:end], line_type
     return None, None
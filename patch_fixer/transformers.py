@@ -8,6 +8,10 @@ from .hunk import find_hunk_start
 from .errors import MissingHunkError, OutOfOrderHunk
 from .utils import split_ab
 
+_DIFF_FILE_NAME = re.compile(r'diff.*?a/(.*?)\s+b/')
+# prefixes of the lines fix_malformed_headers may rewrite
+_HEADER_PREFIXES = ("diff ", "---", "+++")
+
 
 def fix_hunk_header(
         hunk_lines: List[str],
@@ -220,6 +224,11 @@ def fix_malformed_headers(patch_lines: List[str]) -> List[str]:
     in_diff = False
 
     for i, line in enumerate(patch_lines):
+        # most lines are hunk bodies, so rule them out with a single check
+        if not line.startswith(_HEADER_PREFIXES):
+            fixed.append(line)
+            continue
+
         # detect start of a new diff block
         if line.startswith("diff "):
             in_diff = True
@@ -268,34 +277,29 @@ def split_patch_by_file(patch_lines: List[str]) -> List[Tuple[str, List[str]]]:
     List[Tuple[str, List[str]]]
         List of tuples (filename, patch_lines_for_file)
     """
-    files = []
-    current_file = None
-    current_lines = []
+    # find where each file's diff starts, then hand out one slice per file
+    # rather than appending the lines one at a time
+    starts = [i for i, line in enumerate(patch_lines) if line.startswith("diff ")]
+    starts.append(len(patch_lines))
 
-    for line in patch_lines:
-        if line.startswith("diff "):
-            # save previous file if any
-            if current_file and current_lines:
-                files.append((current_file, current_lines))
-
-            # start new file
-            # extract filename from diff line
-            match = re.search(r'diff.*?a/(.*?)\s+b/', line)
-            if match:
-                current_file = match.group(1)
-            else:
-                # fallback: try to extract any filename
-                parts = line.split()
-                current_file = parts[-1] if parts else "unknown"
-                if current_file.startswith("b/"):
-                    current_file = current_file[2:]
-
-            current_lines = [line]
-        elif current_lines is not None:
-            current_lines.append(line)
-
-    # don't forget the last file
-    if current_file and current_lines:
-        files.append((current_file, current_lines))
-
-    return files
\ No newline at end of file
+    files = []
+    for start, end in zip(starts, starts[1:]):
+        filename = _diff_file_name(patch_lines[start])
+        if filename:
+            files.append((filename, patch_lines[start:end]))
+
+    return files
+
+
+def _diff_file_name(diff_line: str) -> str:
+    """Extract the file name from a diff header line."""
+    match = _DIFF_FILE_NAME.search(diff_line)
+    if match:
+        return match.group(1)
+
+    # fallback: try to extract any filename
+    parts = diff_line.split()
+    filename = parts[-1] if parts else "unknown"
+    if filename.startswith("b/"):
+        filename = filename[2:]
+    return filename
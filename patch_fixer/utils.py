@@ -6,6 +6,11 @@ def normalize_line(line):
     if not isinstance(line, str):
         raise TypeError(f"Cannot normalize non-string object {line}")
 
+    # fast path: a line that already ends in a lone LF is returned as is,
+    # without slicing off the terminator and concatenating it back on
+    if line.endswith("\n") and "\r" not in line and line.find("\n") == len(line) - 1:
+        return line
+
     # edge case: empty string
     if line == "":
         return "\n"
@@ -1,12 +1,62 @@
 """Pure validation functions for patch components."""
 
 import re
+from collections import Counter
+from operator import itemgetter
 from typing import Tuple, Optional, Dict, Any
 
-from .regex import match_line, regexes
+from .regex import regexes
 from .errors import InvalidPatchError
 from .utils import split_ab
 
+# each validator only accepts one kind of line, so it matches that pattern
+# directly rather than trying every pattern in turn via match_line
+_HUNK_HEADER = regexes["HUNK_HEADER"]
+_DIFF_LINE = regexes["DIFF_LINE"]
+_FILE_HEADERS = {
+    "start": regexes["FILE_HEADER_START"],
+    "end": regexes["FILE_HEADER_END"],
+}
+_INDEX_LINE = regexes["INDEX_LINE"]
+_SIMILARITY_LINE = regexes["SIMILARITY_LINE"]
+_MODE_LINE = regexes["MODE_LINE"]
+
+_FIRST_CHAR = itemgetter(slice(None, 1))
+# counter a hunk line goes to by its first character: added, removed or context
+_LINE_KINDS = {'+': 0, '-': 1, ' ': 2, '': 2}
+
+
+def _parse_range(text: str) -> Optional[Tuple[int, int]]:
+    """Parse 'start[,count]' from a hunk header, or None if it isn't plain digits."""
+    start, comma, count = text.partition(",")
+    if not (start.isascii() and start.isdigit()):
+        return None
+    if not comma:
+        return int(start), 1
+    if not (count.isascii() and count.isdigit()):
+        return None
+    return int(start), int(count)
+
+
+def _scan_hunk_header(header_line: str) -> Optional[Tuple[int, int, int, int, str]]:
+    """Parse a well-formed hunk header without regex, or None if anything looks off."""
+    if not header_line.startswith("@@ -"):
+        return None
+    plus = header_line.find(" +", 4)
+    if plus < 0:
+        return None
+    end = header_line.find(" @@", plus + 2)
+    if end < 0:
+        return None
+    old = _parse_range(header_line[4:plus])
+    new = _parse_range(header_line[plus + 2:end])
+    context = header_line[end + 3:]
+    if context.endswith("\n"):
+        context = context[:-1]  # like the regex's $, allow a single final newline
+    if old is None or new is None or "\n" in context:
+        return None
+    return old[0], old[1], new[0], new[1], context
+
 
 def validate_hunk_header(header_line: str) -> Tuple[int, int, int, int, str]:
     """
@@ -27,19 +77,42 @@ def validate_hunk_header(header_line: str) -> Tuple[int, int, int, int, str]:
     InvalidPatchError
         If header is malformed
     """
-    match_groups, line_type = match_line(header_line)
-    if line_type != "HUNK_HEADER":
+    # almost every header is well-formed, so try the plain string scan first
+    # and leave the regex to decide the odd cases
+    parsed = _scan_hunk_header(header_line)
+    if parsed is not None:
+        return parsed
+
+    match = _HUNK_HEADER.match(header_line)
+    if not match:
         raise InvalidPatchError(f"Invalid hunk header: {header_line}")
 
-    old_start = int(match_groups[0]) if match_groups[0] else 0
-    old_count = int(match_groups[1]) if match_groups[1] else 1
-    new_start = int(match_groups[2]) if match_groups[2] else 0
-    new_count = int(match_groups[3]) if match_groups[3] else 1
-    context = match_groups[4] if len(match_groups) > 4 else ""
+    old_start, old_count, new_start, new_count, context = match.groups()
+    old_start = int(old_start)
+    old_count = int(old_count) if old_count else 1
+    new_start = int(new_start)
+    new_count = int(new_count) if new_count else 1
 
     return old_start, old_count, new_start, new_count, context
 
 
+def _scan_diff_header(diff_line: str) -> Optional[Tuple[str, str]]:
+    """Split an unambiguous diff header by slicing, or None if regex is needed."""
+    if not diff_line.startswith("diff --git a/"):
+        return None
+    rest = diff_line[11:-1] if diff_line.endswith("\n") else diff_line[11:]
+    # paths may contain single spaces, so only take the easy case: exactly one
+    # " b/" and nothing the path pattern would reject
+    if rest.count(" b/") != 1 or "\t" in rest or "\n" in rest or "  " in rest or rest.endswith(" "):
+        return None
+    sep = rest.find(" b/")
+    source = rest[2:sep]
+    dest = rest[sep + 3:]
+    if not source or not dest or source[0] == " " or dest[0] == " ":
+        return None
+    return source, dest
+
+
 def validate_diff_header(diff_line: str) -> Tuple[str, str]:
     """
     Validate and parse diff header.
@@ -59,11 +132,15 @@ def validate_diff_header(diff_line: str) -> Tuple[str, str]:
     InvalidPatchError
         If header is malformed
     """
-    match_groups, line_type = match_line(diff_line)
-    if line_type != "DIFF_LINE":
+    parsed = _scan_diff_header(diff_line)
+    if parsed is not None:
+        return parsed
+
+    match = _DIFF_LINE.match(diff_line)
+    if not match:
         raise InvalidPatchError(f"Invalid diff header: {diff_line}")
 
-    source, dest = match_groups
+    source, dest = match.groups()
 
     # remove a/ and b/ prefixes
     if source.startswith("a/"):
@@ -95,14 +172,11 @@ def validate_file_header(header_line: str, header_type: str) -> str:
     InvalidPatchError
         If header is malformed
     """
-    match_groups, line_type = match_line(header_line)
+    match = _FILE_HEADERS[header_type].match(header_line)
+    if not match:
+        raise InvalidPatchError(f"Invalid file {header_type} header: {header_line}")
 
-    if header_type == "start" and line_type != "FILE_HEADER_START":
-        raise InvalidPatchError(f"Invalid file start header: {header_line}")
-    elif header_type == "end" and line_type != "FILE_HEADER_END":
-        raise InvalidPatchError(f"Invalid file end header: {header_line}")
-
-    file_path = match_groups[0]
+    file_path = match.group(1)
 
     # handle special paths
     if file_path in ("/dev/null", "nul"):
@@ -136,14 +210,15 @@ def validate_index_line(index_line: str) -> Dict[str, Any]:
     InvalidPatchError
         If line is malformed
     """
-    match_groups, line_type = match_line(index_line)
-    if line_type != "INDEX_LINE":
+    match = _INDEX_LINE.match(index_line)
+    if not match:
         raise InvalidPatchError(f"Invalid index line: {index_line}")
 
+    old_hash, new_hash, mode = match.groups()
     return {
-        'old_hash': match_groups[0],
-        'new_hash': match_groups[1],
-        'mode': match_groups[2] if len(match_groups) > 2 else None
+        'old_hash': old_hash,
+        'new_hash': new_hash,
+        'mode': mode
     }
 
 
@@ -166,11 +241,11 @@ def validate_similarity_line(similarity_line: str) -> int:
     InvalidPatchError
         If line is malformed
     """
-    match_groups, line_type = match_line(similarity_line)
-    if line_type != "SIMILARITY_LINE":
+    match = _SIMILARITY_LINE.match(similarity_line)
+    if not match:
         raise InvalidPatchError(f"Invalid similarity line: {similarity_line}")
 
-    return int(match_groups[0])
+    return int(match.group(1))
 
 
 def validate_mode_line(mode_line: str) -> Tuple[str, str]:
@@ -192,13 +267,12 @@ def validate_mode_line(mode_line: str) -> Tuple[str, str]:
     InvalidPatchError
         If line is malformed
     """
-    match_groups, line_type = match_line(mode_line)
-    if line_type != "MODE_LINE":
+    match = _MODE_LINE.match(mode_line)
+    if not match:
         raise InvalidPatchError(f"Invalid mode line: {mode_line}")
 
     # now the regex captures both operation and mode
-    operation = match_groups[0]
-    mode = match_groups[1] if match_groups[1] else "100644"
+    operation, mode = match.groups()
 
     return operation, mode
 
@@ -217,8 +291,12 @@ def is_binary_diff(patch_lines: list) -> bool:
     bool
         True if this is a binary diff
     """
+    # git puts these markers at the start of their own line, right after the
+    # diff header, so there is no need to search inside every line
     for line in patch_lines[:20]:  # check first 20 lines
-        if "Binary files" in line or "binary patch" in line.lower():
+        if line.startswith("Binary files ") and line.rstrip().endswith(" differ"):
+            return True
+        if line.startswith("GIT binary patch"):
             return True
     return False
 
@@ -237,16 +315,19 @@ def count_hunk_lines(hunk_lines: list) -> Tuple[int, int, int]:
     tuple
         (added_count, removed_count, context_count)
     """
-    added = 0
-    removed = 0
-    context = 0
-
-    for line in hunk_lines:
-        if line.startswith('+'):
-            added += 1
-        elif line.startswith('-'):
-            removed += 1
-        elif line.startswith(' ') or line.strip() == "":
-            context += 1
-
-    return added, removed, context
\ No newline at end of file
+    # tally lines by first character in C rather than branching per line in Python
+    counts = [0, 0, 0]
+    others = set()
+    for char, n in Counter(map(_FIRST_CHAR, hunk_lines)).items():
+        kind = _LINE_KINDS.get(char)
+        if kind is not None:
+            counts[kind] += n
+        elif char.isspace():
+            others.add(char)
+
+    # anything else only counts if the whole line is blank, which needs a closer look
+    if others:
+        counts[2] += sum(1 for line in hunk_lines if line[:1] in others and line.strip() == "")
+
+    added, removed, context = counts
+    return added, removed, context
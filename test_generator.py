@@ -5,211 +5,228 @@ import random
 import argparse
 from pathlib import Path
 
-HUNK_HEADER = re.compile(r'^@@ -(\d+)(?:,(\d+))? \+(\d+)(?:,(\d+))? @@(.*)$')
-FILE_HEADER = re.compile(r'^(---|\+\+\+) ([^\t\n]+)(?:\t(.+))?')
+# patches are handled as raw bytes throughout, since corruptions only ever
+# inspect ASCII prefixes and there's no need to pay for decoding
+HUNK_HEADER = re.compile(rb'^@@ -(\d+)(?:,(\d+))? \+(\d+)(?:,(\d+))? @@(.*)$')
+FILE_HEADER = re.compile(rb'^(---|\+\+\+) ([^\t\n]+)(?:\t(.+))?$', re.MULTILINE)
+HUNK_FMT = b'@@ -%d,%d +%d,%d @@%s\n'.__mod__
+
+def header_offsets(text):
+    """Locate every ---/+++ file header line in a joined patch in one scan.
+    
+    Returns (start, end, kind) tuples, where end includes the line's newline.
+    """
+    return [(m.start(), m.end() + 1, m.group(1)) for m in FILE_HEADER.finditer(text)]
 
 class PatchCorruptor:
     """Generate test cases by corrupting valid patches in various ways."""
     
     def __init__(self, patch_lines):
-        self.original_lines = patch_lines.copy()
+        self.original_lines = tuple(patch_lines)
         self.test_cases = []
+        self._first_hunk = next(
+            (i for i, line in enumerate(self.original_lines) if HUNK_HEADER.match(line)), None
+        )
+    
+    def _drop_first(self, text, headers, kind):
+        """Return text as chunks, minus the first file header of the given kind."""
+        for start, end, header_kind in headers:
+            if header_kind == kind:
+                return [text[:start], text[end:]]
+        return [text]
     
     def corrupt_file_headers(self):
         """Create test cases with corrupted file headers."""
-        lines = self.original_lines.copy()
-        test_cases = []
+        text = b''.join(self.original_lines)
+        headers = header_offsets(text)
         
         # Missing --- header
-        case1 = []
-        skip_next_minus = True
-        for line in lines:
-            if skip_next_minus and line.startswith('---'):
-                skip_next_minus = False
-                continue
-            case1.append(line)
-        test_cases.append(('missing_minus_header', case1))
+        yield 'missing_minus_header', self._drop_first(text, headers, b'---')
         
         # Missing +++ header
-        case2 = []
-        skip_next_plus = True
-        for line in lines:
-            if skip_next_plus and line.startswith('+++'):
-                skip_next_plus = False
-                continue
-            case2.append(line)
-        test_cases.append(('missing_plus_header', case2))
+        yield 'missing_plus_header', self._drop_first(text, headers, b'+++')
         
         # Swapped headers
         case3 = []
-        i = 0
-        while i < len(lines):
-            if i + 1 < len(lines) and lines[i].startswith('---') and lines[i+1].startswith('+++'):
-                case3.append(lines[i+1])  # Swap
-                case3.append(lines[i])
-                i += 2
-            else:
-                case3.append(lines[i])
-                i += 1
-        test_cases.append(('swapped_headers', case3))
+        pos = 0
+        for (minus_start, minus_end, kind), (plus_start, plus_end, next_kind) in zip(headers, headers[1:]):
+            if kind == b'---' and next_kind == b'+++' and minus_end == plus_start:
+                case3.append(text[pos:minus_start])
+                case3.append(text[plus_start:plus_end])  # Swap
+                case3.append(text[minus_start:minus_end])
+                pos = plus_end
+        case3.append(text[pos:])
+        yield 'swapped_headers', case3
         
         # Malformed paths
         case4 = []
-        for line in lines:
-            if line.startswith('---'):
-                case4.append('--- this/is/wrong/path.txt\n')
-            elif line.startswith('+++'):
-                case4.append('+++ another/wrong/path.txt\n')
+        pos = 0
+        for start, end, kind in headers:
+            case4.append(text[pos:start])
+            if kind == b'---':
+                case4.append(b'--- this/is/wrong/path.txt\n')
             else:
-                case4.append(line)
-        test_cases.append(('wrong_paths', case4))
-        
-        return test_cases
+                case4.append(b'+++ another/wrong/path.txt\n')
+            pos = end
+        case4.append(text[pos:])
+        yield 'wrong_paths', case4
     
     def corrupt_hunk_headers(self):
         """Create test cases with corrupted hunk headers."""
-        test_cases = []
-        
         # Wrong line numbers
         case1 = []
         for line in self.original_lines:
             match = HUNK_HEADER.match(line)
             if match:
                 old_start = random.randint(1, 100)
-                old_count = match.group(2) or '1'
+                old_count = int(match.group(2) or 1)
                 new_start = random.randint(1, 100)
-                new_count = match.group(4) or '1'
-                context = match.group(5) or ''
-                case1.append(f'@@ -{old_start},{old_count} +{new_start},{new_count} @@{context}\n')
+                new_count = int(match.group(4) or 1)
+                context = match.group(5) or b''
+                case1.append(HUNK_FMT((old_start, old_count, new_start, new_count, context)))
             else:
                 case1.append(line)
-        test_cases.append(('wrong_line_numbers', case1))
+        yield 'wrong_line_numbers', case1
         
         # Wrong line counts
         case2 = []
         for line in self.original_lines:
             match = HUNK_HEADER.match(line)
             if match:
-                old_start = match.group(1)
-                old_count = str(random.randint(1, 20))
-                new_start = match.group(3)
-                new_count = str(random.randint(1, 20))
-                context = match.group(5) or ''
-                case2.append(f'@@ -{old_start},{old_count} +{new_start},{new_count} @@{context}\n')
+                old_start = int(match.group(1))
+                old_count = random.randint(1, 20)
+                new_start = int(match.group(3))
+                new_count = random.randint(1, 20)
+                context = match.group(5) or b''
+                case2.append(HUNK_FMT((old_start, old_count, new_start, new_count, context)))
             else:
                 case2.append(line)
-        test_cases.append(('wrong_line_counts', case2))
+        yield 'wrong_line_counts', case2
         
         # Missing hunk headers
-        case3 = []
-        skip_next_hunk = True
-        for line in self.original_lines:
-            if skip_next_hunk and HUNK_HEADER.match(line):
-                skip_next_hunk = False
-                continue
-            case3.append(line)
-        test_cases.append(('missing_hunk_header', case3))
+        i = self._first_hunk
+        if i is None:
+            yield 'missing_hunk_header', self.original_lines
+        else:
+            yield 'missing_hunk_header', self.original_lines[:i] + self.original_lines[i+1:]
         
         # Malformed hunk header format
         case4 = []
         for line in self.original_lines:
             if HUNK_HEADER.match(line):
-                case4.append('@@ malformed hunk header @@\n')
+                case4.append(b'@@ malformed hunk header @@\n')
             else:
                 case4.append(line)
-        test_cases.append(('malformed_hunk_header', case4))
-        
-        return test_cases
+        yield 'malformed_hunk_header', case4
     
     def corrupt_content(self):
         """Create test cases with corrupted content."""
-        test_cases = []
-        
         # Extra whitespace
         case1 = []
         for line in self.original_lines:
-            if line.startswith(('+', '-', ' ')) and not line.startswith(('+++', '---')):
-                case1.append(line.rstrip() + '    \n')  # Add trailing whitespace
+            if line.startswith((b'+', b'-', b' ')) and not line.startswith((b'+++', b'---')):
+                case1.append(line.rstrip() + b'    \n')  # Add trailing whitespace
             else:
                 case1.append(line)
-        test_cases.append(('extra_whitespace', case1))
+        yield 'extra_whitespace', case1
         
         # Mixed line endings
         case2 = []
         for i, line in enumerate(self.original_lines):
             if i % 2 == 0:
-                case2.append(line.rstrip('\r\n') + '\r\n')
+                case2.append(line.rstrip(b'\r\n') + b'\r\n')
             else:
-                case2.append(line.rstrip('\r\n') + '\n')
-        test_cases.append(('mixed_line_endings', case2))
+                case2.append(line.rstrip(b'\r\n') + b'\n')
+        yield 'mixed_line_endings', case2
         
         # Missing context lines
         case3 = []
         skip_context = 0
         for line in self.original_lines:
-            if line.startswith(' ') and skip_context < 2:
+            if line.startswith(b' ') and skip_context < 2:
                 skip_context += 1
                 continue
             case3.append(line)
-        test_cases.append(('missing_context', case3))
+        yield 'missing_context', case3
         
         # Duplicated lines
         case4 = []
         for line in self.original_lines:
             case4.append(line)
-            if line.startswith('+') and random.random() < 0.3:
+            if line.startswith(b'+') and random.random() < 0.3:
                 case4.append(line)  # Duplicate some additions
-        test_cases.append(('duplicated_lines', case4))
+        yield 'duplicated_lines', case4
         
         # Wrong prefixes
         case5 = []
         for line in self.original_lines:
-            if line.startswith(' ') and random.random() < 0.1:
-                case5.append('?' + line[1:])  # Wrong prefix
+            if line.startswith(b' ') and random.random() < 0.1:
+                case5.append(b'?' + line[1:])  # Wrong prefix
             else:
                 case5.append(line)
-        test_cases.append(('wrong_prefixes', case5))
-        
-        return test_cases
+        yield 'wrong_prefixes', case5
     
     def generate_all_test_cases(self):
         """Generate all types of test cases."""
-        all_cases = []
-        all_cases.extend(self.corrupt_file_headers())
-        all_cases.extend(self.corrupt_hunk_headers())
-        all_cases.extend(self.corrupt_content())
-        return all_cases
+        yield from self.corrupt_file_headers()
+        yield from self.corrupt_hunk_headers()
+        yield from self.corrupt_content()
     
     def generate_combined_corruption(self):
         """Generate a test case with multiple types of corruption."""
-        lines = self.original_lines.copy()
-        
-        # Apply multiple corruptions
-        corruptions_applied = []
+        # Apply multiple corruptions in a single pass, writing each
+        # (possibly rewritten) line straight into one contiguous buffer
+        buf = bytearray()
+        corrupted_hunk = False
+        added_whitespace = False
         
-        # Randomly corrupt some hunk headers
-        for i, line in enumerate(lines):
-            if HUNK_HEADER.match(line) and random.random() < 0.5:
+        for i, line in enumerate(self.original_lines):
+            # Randomly corrupt one hunk header
+            if not corrupted_hunk and HUNK_HEADER.match(line) and random.random() < 0.5:
                 old_start = random.randint(1, 50)
-                lines[i] = re.sub(r'-\d+', f'-{old_start}', line)
-                corruptions_applied.append('wrong_line_number')
-                break
-        
-        # Add some whitespace issues
-        for i, line in enumerate(lines):
-            if line.startswith(('+', '-', ' ')) and random.random() < 0.3:
-                lines[i] = line.rstrip() + '   \n'
-                if 'extra_whitespace' not in corruptions_applied:
-                    corruptions_applied.append('extra_whitespace')
+                line = re.sub(rb'-\d+', b'-%d' % old_start, line)
+                corrupted_hunk = True
+            
+            # Add some whitespace issues
+            elif line.startswith((b'+', b'-', b' ')) and random.random() < 0.3:
+                line = line.rstrip() + b'   \n'
+                added_whitespace = True
+            
+            # Mix line endings
+            if i % 3 == 0:
+                buf += line.rstrip(b'\r\n')
+                buf += b'\r\n'
+            else:
+                buf += line
         
-        # Mix line endings
-        for i in range(0, len(lines), 3):
-            if i < len(lines):
-                lines[i] = lines[i].rstrip('\r\n') + '\r\n'
+        corruptions_applied = []
+        if corrupted_hunk:
+            corruptions_applied.append('wrong_line_number')
+        if added_whitespace:
+            corruptions_applied.append('extra_whitespace')
         corruptions_applied.append('mixed_endings')
         
         name = 'combined_' + '_'.join(corruptions_applied)[:50]
-        return (name, lines)
+        return (name, [buf])  # already a single contiguous chunk
+
+def iter_test_cases(corruptor, types, count):
+    """Lazily yield (name, lines) for each requested type of test case."""
+    if 'all' in types:
+        yield from corruptor.generate_all_test_cases()
+    else:
+        if 'headers' in types:
+            yield from corruptor.corrupt_file_headers()
+        if 'hunks' in types:
+            yield from corruptor.corrupt_hunk_headers()
+        if 'content' in types:
+            yield from corruptor.corrupt_content()
+    
+    if 'combined' in types or 'all' in types:
+        for i in range(count):
+            name, lines = corruptor.generate_combined_corruption()
+            if count > 1:
+                name = f"{name}_{i+1}"
+            yield name, lines
 
 def main():
     parser = argparse.ArgumentParser(description='Generate test cases from valid git diff')
@@ -225,40 +242,21 @@ def main():
     args = parser.parse_args()
     
     # Read input patch
-    with open(args.input_patch, 'r', encoding='utf-8') as f:
-        patch_lines = f.readlines()
+    patch_lines = Path(args.input_patch).read_bytes().splitlines(keepends=True)
     
     # Create output directory
     output_path = Path(args.output_dir)
     output_path.mkdir(parents=True, exist_ok=True)
     
     corruptor = PatchCorruptor(patch_lines)
-    test_cases = []
-    
-    # Generate requested test cases
-    if 'all' in args.types:
-        test_cases = corruptor.generate_all_test_cases()
-    else:
-        if 'headers' in args.types:
-            test_cases.extend(corruptor.corrupt_file_headers())
-        if 'hunks' in args.types:
-            test_cases.extend(corruptor.corrupt_hunk_headers())
-        if 'content' in args.types:
-            test_cases.extend(corruptor.corrupt_content())
-    
-    if 'combined' in args.types or 'all' in args.types:
-        for i in range(args.count):
-            name, lines = corruptor.generate_combined_corruption()
-            if args.count > 1:
-                name = f"{name}_{i+1}"
-            test_cases.append((name, lines))
     
-    # Write test cases
-    print(f"Generating {len(test_cases)} test cases in {output_path}")
-    for name, lines in test_cases:
+    # Write test cases as they are generated, keeping only their names around
+    print(f"Generating test cases in {output_path}")
+    names = []
+    for name, lines in iter_test_cases(corruptor, args.types, args.count):
         output_file = output_path / f"test_{name}.patch"
-        with open(output_file, 'w', encoding='utf-8') as f:
-            f.writelines(lines)
+        output_file.write_bytes(b''.join(lines))
+        names.append(name)
         print(f"  Created: {output_file.name}")
     
     # Create a description file
@@ -266,13 +264,13 @@ def main():
     with open(desc_file, 'w') as f:
         f.write("Test Cases Generated\n")
         f.write("=" * 50 + "\n\n")
-        for name, _ in test_cases:
+        for name in names:
             f.write(f"test_{name}.patch:\n")
             f.write(f"  Type: {name.replace('_', ' ').title()}\n")
             f.write("\n")
     
     print(f"\nTest descriptions written to: {desc_file.name}")
-    print(f"Total test cases generated: {len(test_cases)}")
+    print(f"Total test cases generated: {len(names)}")
 
 if __name__ == "__main__":
     main()
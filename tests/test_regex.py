@@ -0,0 +1,41 @@
+"""Tests for the regex module."""
+
+import pytest
+from patch_fixer.regex import _classify_line, match_line, regexes
+
+
+LINES = {
+    "DIFF_LINE": "diff --git a/x b/x\n",
+    "MODE_LINE": "new file mode 100644\n",
+    "INDEX_LINE": "index abcdef0..1234567 100644\n",
+    "SIMILARITY_LINE": "similarity index 90%\n",
+    "BINARY_LINE": "Binary files a/x and b/x differ\n",
+    "RENAME_FROM": "rename from a\n",
+    "RENAME_TO": "rename to b\n",
+    "FILE_HEADER_START": "--- a/x\n",
+    "FILE_HEADER_END": "+++ b/x\n",
+    "HUNK_HEADER": "@@ -1,2 +1,3 @@ ctx\n",
+    "END_LINE": "\\ No newline at end of file\n",
+}
+
+
+class TestMatchLine:
+
+    def test_every_line_type_covered(self):
+        """Test that there is a sample line for each line type."""
+        assert set(LINES) == set(regexes)
+
+    @pytest.mark.parametrize("line_type,line", LINES.items())
+    def test_classify_and_match_agree(self, line_type, line):
+        """Test that _classify_line and match_line agree on each line type."""
+        classified_type, match = _classify_line(line)
+        groups, matched_type = match_line(line)
+        assert classified_type == matched_type == line_type
+        assert match is not None
+        # groups are those of the line type's own regex
+        assert groups == regexes[line_type].match(line).groups()
+
+    def test_no_match(self):
+        """Test that an ordinary hunk line matches no line type."""
+        assert _classify_line(" ctx\n") == (None, None)
+        assert match_line(" ctx\n") == (None, None)
@@ -44,6 +44,17 @@ class TestValidators:
         assert new_start == 5
         assert new_count == 1
 
+    def test_validate_hunk_header_context_with_markers(self):
+        """Test that only the first @@ after the ranges ends the header."""
+        header = "@@ -1,2 +3,4 @@ x = '@@ -9 +9 @@'\n"
+        assert validate_hunk_header(header) == (1, 2, 3, 4, " x = '@@ -9 +9 @@'")
+
+    def test_validate_hunk_header_non_numeric_range(self):
+        """Test that ranges with anything but digits are rejected."""
+        for header in ("@@ -1, +1 @@\n", "@@ -a,1 +1 @@\n", "@@ -1,2 +\u00b2 @@\n"):
+            with pytest.raises(InvalidPatchError):
+                validate_hunk_header(header)
+
     def test_validate_hunk_header_invalid(self):
         """Test that invalid hunk headers raise errors."""
         with pytest.raises(InvalidPatchError):
@@ -63,6 +74,12 @@ class TestValidators:
         assert source == "old.txt"
         assert dest == "new.txt"
 
+    def test_validate_diff_header_with_spaces(self):
+        """Test parsing diff headers whose paths contain spaces."""
+        source, dest = validate_diff_header("diff --git a/my file.txt b/my file.txt\n")
+        assert source == "my file.txt"
+        assert dest == "my file.txt"
+
     def test_validate_file_header_start(self):
         """Test parsing file start headers."""
         header = "--- a/file.txt\n"
@@ -125,6 +142,28 @@ class TestValidators:
         ]
         assert is_binary_diff(text_patch) is False
 
+    def test_is_binary_diff_git_binary_patch(self):
+        """Test binary diff detection for patches made with --binary."""
+        binary_patch = [
+            "diff --git a/image.png b/image.png\n",
+            "index 1234567..89abcde 100644\n",
+            "GIT binary patch\n",
+            "literal 12\n",
+        ]
+        assert is_binary_diff(binary_patch) is True
+
+    def test_is_binary_diff_marker_in_content(self):
+        """Test that the marker text inside a changed line isn't mistaken for a binary diff."""
+        text_patch = [
+            "diff --git a/log.py b/log.py\n",
+            "--- a/log.py\n",
+            "+++ b/log.py\n",
+            "@@ -1 +1 @@\n",
+            "-print('text files differ')\n",
+            "+print('Binary files differ')\n",
+        ]
+        assert is_binary_diff(text_patch) is False
+
     def test_count_hunk_lines(self):
         """Test counting lines in a hunk."""
         hunk = [